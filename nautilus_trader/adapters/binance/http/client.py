@@ -54,6 +54,8 @@ class BinanceHttpClient(HttpClient):
         self._clock = clock
         self._key = key
         self._secret = secret
+        # HMAC template for request signing
+        self._hmac = hmac.new(secret.encode(), digestmod=hashlib.sha256)
         self._base_url = base_url or self.BASE_URL
         self._show_limit_usage = show_limit_usage
         self._proxies = None
@@ -174,8 +176,9 @@ class BinanceHttpClient(HttpClient):
         except msgspec.MsgspecError:
             self._log.error(f"Could not decode data to JSON: {resp.data}.")
 
-    def _get_sign(self, data) -> str:
-        m = hmac.new(self._secret.encode(), data.encode(), hashlib.sha256)
+    def _get_sign(self, data: str) -> str:
+        m = self._hmac.copy()
+        m.update(data.encode())
         return m.hexdigest()
 
     async def _handle_exception(self, error: aiohttp.ClientResponseError) -> None:
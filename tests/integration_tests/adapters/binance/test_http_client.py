@@ -0,0 +1,48 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+
+from nautilus_trader.adapters.binance.http.client import BinanceHttpClient
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import Logger
+
+
+class TestBinanceHttpClient:
+    def setup(self):
+        # Fixture Setup
+        clock = LiveClock()
+        logger = Logger(clock=clock)
+        # Example key pair from the Binance API docs (SIGNED endpoint examples)
+        self.client = BinanceHttpClient(  # noqa: S106 (no hardcoded password)
+            loop=asyncio.get_event_loop(),
+            clock=clock,
+            logger=logger,
+            key="vmPUZE6mv9SD5VNHk4HlWFsOr6aKE2zvsw0MuIgwCIPy6utIco14y7Ju91duEh8A",
+            secret="NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j",
+        )
+
+    def test_get_sign_returns_expected_signature_for_repeated_requests(self):
+        # Arrange
+        query_string = "symbol=LTCBTC&side=BUY&type=LIMIT&timeInForce=GTC&quantity=1&price=0.1&recvWindow=5000&timestamp=1499827319559"  # noqa
+
+        # Act
+        result1 = self.client._get_sign(query_string)
+        result2 = self.client._get_sign(query_string)
+
+        # Assert
+        expected = "c8db56825ae71d6d79447849e617115f4a920fa2acdcab2b053c4b2838bd6b71"
+        assert result1 == expected
+        assert result2 == expected
@@ -14,6 +14,8 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import pkgutil
+from typing import Optional
 
 import pytest
 
@@ -249,3 +251,43 @@ class TestBinanceSpotMarketHttpAPI:
         assert request["method"] == "GET"
         assert request["url"] == "https://api.binance.com/api/v3/avgPrice"
         assert request["params"] == "symbol=BTCUSDT"
+
+
+class TestBinanceSpotMarketHttpReplay:
+    @pytest.mark.asyncio
+    async def test_query_depth_decodes_recorded_response(self, monkeypatch, binance_http_client):
+        # Arrange: prepare data for monkey patch
+        response = pkgutil.get_data(
+            package="tests.integration_tests.adapters.binance.resources.http_responses",
+            resource="http_spot_market_depth.json",
+        )
+        requests = []
+
+        # Mock coroutine for patch
+        async def mock_send_request(
+            self,  # noqa (needed for mock)
+            http_method: str,
+            url_path: str,
+            payload: Optional[dict[str, str]] = None,
+        ) -> bytes:
+            requests.append((http_method, url_path, payload))
+            return response
+
+        # Apply mock coroutine to client (before endpoints bind `send_request`)
+        monkeypatch.setattr(
+            target=BinanceHttpClient,
+            name="send_request",
+            value=mock_send_request,
+        )
+        api = BinanceSpotMarketHttpAPI(binance_http_client)
+
+        # Act
+        depth = await api.query_depth(symbol="ETHUSDT", limit=10)
+
+        # Assert
+        assert requests == [("GET", "/api/v3/depth", {"symbol": "ETHUSDT", "limit": 10})]
+        assert depth.lastUpdateId == 14527958487
+        assert len(depth.bids) == 10
+        assert len(depth.asks) == 10
+        assert depth.bids[0] == ("60650.00000000", "0.00213000")
+        assert depth.asks[0] == ("60650.01000000", "0.61982000")
@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from functools import lru_cache
+from typing import Optional
+
 import pytest
 
 from nautilus_trader.accounting.accounts.cash import CashAccount
@@ -26,6 +29,7 @@ from nautilus_trader.model.currencies import ETH
 from nautilus_trader.model.currencies import JPY
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.currency import Currency
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import LiquiditySide
 from nautilus_trader.model.enums import OrderSide
@@ -46,23 +50,63 @@ from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
-USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 ADABTC_BINANCE = TestInstrumentProvider.adabtc_binance()
 BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
 AAPL_NASDAQ = TestInstrumentProvider.aapl_equity()
+XBTUSD_BITMEX = TestInstrumentProvider.xbtusd_bitmex()
+USDJPY_IDEALPRO = TestInstrumentProvider.default_fx_ccy("USD/JPY", Venue("IDEALPRO"))
 
+XBTUSD_QTY = Quantity.from_int(100_000)
+XBTUSD_PX = Price.from_str("11450.50")
 
-class TestCashAccount:
-    def setup(self):
-        # Fixture Setup
-        self.trader_id = TestIdStubs.trader_id()
-
-        self.order_factory = OrderFactory(
-            trader_id=self.trader_id,
-            strategy_id=StrategyId("S-001"),
-            clock=TestClock(),
-        )
 
+@lru_cache(maxsize=None)
+def _money(value: float, currency: Currency) -> Money:
+    return Money(value, currency)
+
+
+def _balance(currency: Currency, total: float, locked: float, free: float) -> AccountBalance:
+    return AccountBalance(
+        _money(total, currency),
+        _money(locked, currency),
+        _money(free, currency),
+    )
+
+
+def _make_account(
+    balances: list[AccountBalance],
+    base_currency: Optional[Currency] = None,
+) -> CashAccount:
+    event = AccountState(
+        account_id=AccountId("SIM-001"),
+        account_type=AccountType.CASH,
+        base_currency=base_currency,
+        reported=True,
+        balances=balances,
+        margins=[],
+        info={},  # No default currency set
+        event_id=UUID4(),
+        ts_event=0,
+        ts_init=0,
+    )
+    return CashAccount(event)
+
+
+@pytest.fixture(scope="class")
+def clock():
+    return TestClock()
+
+
+@pytest.fixture(scope="class")
+def order_factory(clock):
+    return OrderFactory(
+        trader_id=TestIdStubs.trader_id(),
+        strategy_id=StrategyId("S-001"),
+        clock=clock,
+    )
+
+
+class TestCashAccount:
     def test_instantiated_accounts_basic_properties(self):
         # Arrange, Act
         account = TestExecStubs.cash_account()
@@ -90,11 +134,7 @@ class TestCashAccount:
             base_currency=USD,
             reported=True,
             balances=[
-                AccountBalance(
-                    Money(1_000_000, USD),
-                    Money(0, USD),
-                    Money(1_000_000, USD),
-                ),
+                _balance(USD, 1_000_000, 0, 1_000_000),
             ],
             margins=[],
             info={},
@@ -126,16 +166,8 @@ class TestCashAccount:
             base_currency=None,  # Multi-currency
             reported=True,
             balances=[
-                AccountBalance(
-                    Money(10.00000000, BTC),
-                    Money(0.00000000, BTC),
-                    Money(10.00000000, BTC),
-                ),
-                AccountBalance(
-                    Money(20.00000000, ETH),
-                    Money(0.00000000, ETH),
-                    Money(20.00000000, ETH),
-                ),
+                _balance(BTC, 10.00000000, 0.00000000, 10.00000000),
+                _balance(ETH, 20.00000000, 0.00000000, 20.00000000),
             ],
             margins=[],
             info={},  # No default currency set
@@ -180,16 +212,8 @@ class TestCashAccount:
             base_currency=None,  # Multi-currency
             reported=True,
             balances=[
-                AccountBalance(
-                    Money(10.00000000, BTC),
-                    Money(0.00000000, BTC),
-                    Money(10.00000000, BTC),
-                ),
-                AccountBalance(
-                    Money(20.00000000, ETH),
-                    Money(0.00000000, ETH),
-                    Money(20.00000000, ETH),
-                ),
+                _balance(BTC, 10.00000000, 0.00000000, 10.00000000),
+                _balance(ETH, 20.00000000, 0.00000000, 20.00000000),
             ],
             margins=[],
             info={},  # No default currency set
@@ -207,16 +231,8 @@ class TestCashAccount:
             base_currency=None,  # Multi-currency
             reported=True,
             balances=[
-                AccountBalance(
-                    Money(9.00000000, BTC),
-                    Money(0.50000000, BTC),
-                    Money(8.50000000, BTC),
-                ),
-                AccountBalance(
-                    Money(20.00000000, ETH),
-                    Money(0.00000000, ETH),
-                    Money(20.00000000, ETH),
-                ),
+                _balance(BTC, 9.00000000, 0.50000000, 8.50000000),
+                _balance(ETH, 20.00000000, 0.00000000, 20.00000000),
             ],
             margins=[],
             info={},  # No default currency set
@@ -241,26 +257,7 @@ class TestCashAccount:
 
     def test_calculate_balance_locked_buy(self):
         # Arrange
-        event = AccountState(
-            account_id=AccountId("SIM-001"),
-            account_type=AccountType.CASH,
-            base_currency=USD,
-            reported=True,
-            balances=[
-                AccountBalance(
-                    Money(1_000_000.00, USD),
-                    Money(0.00, USD),
-                    Money(1_000_000.00, USD),
-                ),
-            ],
-            margins=[],
-            info={},  # No default currency set
-            event_id=UUID4(),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        account = CashAccount(event)
+        account = _make_account([_balance(USD, 1_000_000.00, 0.00, 1_000_000.00)], USD)
 
         # Act
         result = account.calculate_balance_locked(
@@ -275,26 +272,7 @@ class TestCashAccount:
 
     def test_calculate_balance_locked_sell(self):
         # Arrange
-        event = AccountState(
-            account_id=AccountId("SIM-001"),
-            account_type=AccountType.CASH,
-            base_currency=USD,
-            reported=True,
-            balances=[
-                AccountBalance(
-                    Money(1_000_000.00, USD),
-                    Money(0.00, USD),
-                    Money(1_000_000.00, USD),
-                ),
-            ],
-            margins=[],
-            info={},  # No default currency set
-            event_id=UUID4(),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        account = CashAccount(event)
+        account = _make_account([_balance(USD, 1_000_000.00, 0.00, 1_000_000.00)], USD)
 
         # Act
         result = account.calculate_balance_locked(
@@ -309,26 +287,7 @@ class TestCashAccount:
 
     def test_calculate_balance_locked_sell_no_base_currency(self):
         # Arrange
-        event = AccountState(
-            account_id=AccountId("SIM-001"),
-            account_type=AccountType.CASH,
-            base_currency=USD,
-            reported=True,
-            balances=[
-                AccountBalance(
-                    Money(1_000_000.00, USD),
-                    Money(0.00, USD),
-                    Money(1_000_000.00, USD),
-                ),
-            ],
-            margins=[],
-            info={},  # No default currency set
-            event_id=UUID4(),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        account = CashAccount(event)
+        account = _make_account([_balance(USD, 1_000_000.00, 0.00, 1_000_000.00)], USD)
 
         # Act
         result = account.calculate_balance_locked(
@@ -341,199 +300,114 @@ class TestCashAccount:
         # Assert
         assert result == Money(100.00, USD)  # Notional + expected commission
 
-    def test_calculate_pnls_for_single_currency_cash_account(self):
-        # Arrange
-        event = AccountState(
-            account_id=AccountId("SIM-001"),
-            account_type=AccountType.CASH,
-            base_currency=USD,
-            reported=True,
-            balances=[
-                AccountBalance(
-                    Money(1_000_000.00, USD),
-                    Money(0.00, USD),
-                    Money(1_000_000.00, USD),
-                ),
+    @pytest.mark.parametrize(
+        "balances, base_currency, instrument, fills",
+        [
+            [
+                [_balance(USD, 1_000_000.00, 0.00, 1_000_000.00)],
+                USD,
+                AUDUSD_SIM,
+                [
+                    (
+                        OrderSide.BUY,
+                        Quantity.from_int(1_000_000),
+                        Price.from_str("0.80000"),
+                        [Money(-800000.00, USD)],
+                    ),
+                ],
             ],
-            margins=[],
-            info={},  # No default currency set
-            event_id=UUID4(),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        account = CashAccount(event)
-
-        order = self.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(1_000_000),
-        )
-
-        fill = TestEventStubs.order_filled(
-            order,
-            instrument=AUDUSD_SIM,
-            position_id=PositionId("P-123456"),
-            strategy_id=StrategyId("S-001"),
-            last_px=Price.from_str("0.80000"),
-        )
-
-        position = Position(AUDUSD_SIM, fill)
-
-        # Act
-        result = account.calculate_pnls(
-            instrument=AUDUSD_SIM,
-            fill=fill,
-            position=position,
-        )
-
-        # Assert (does not include commission)
-        assert result == [Money(-800000.00, USD)]
-
-    def test_calculate_pnls_for_multi_currency_cash_account_btcusdt(self):
-        # Arrange
-        event = AccountState(
-            account_id=AccountId("SIM-001"),
-            account_type=AccountType.CASH,
-            base_currency=None,  # Multi-currency
-            reported=True,
-            balances=[
-                AccountBalance(
-                    Money(10.00000000, BTC),
-                    Money(0.00000000, BTC),
-                    Money(10.00000000, BTC),
-                ),
-                AccountBalance(
-                    Money(20.00000000, ETH),
-                    Money(0.00000000, ETH),
-                    Money(20.00000000, ETH),
-                ),
+            [
+                [
+                    _balance(BTC, 10.00000000, 0.00000000, 10.00000000),
+                    _balance(ETH, 20.00000000, 0.00000000, 20.00000000),
+                ],
+                None,  # Multi-currency
+                BTCUSDT_BINANCE,
+                [
+                    (
+                        OrderSide.SELL,
+                        Quantity.from_str("0.500000"),
+                        Price.from_str("45500.00"),
+                        [Money(-0.50000000, BTC), Money(22750.00000000, USDT)],
+                    ),
+                    (
+                        OrderSide.BUY,
+                        Quantity.from_str("0.500000"),
+                        Price.from_str("45500.00"),
+                        [Money(0.50000000, BTC), Money(-22750.00000000, USDT)],
+                    ),
+                ],
             ],
-            margins=[],
-            info={},  # No default currency set
-            event_id=UUID4(),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        account = CashAccount(event)
-
-        order1 = self.order_factory.market(
-            BTCUSDT_BINANCE.id,
-            OrderSide.SELL,
-            Quantity.from_str("0.500000"),
-        )
-
-        fill1 = TestEventStubs.order_filled(
-            order1,
-            instrument=BTCUSDT_BINANCE,
-            position_id=PositionId("P-123456"),
-            strategy_id=StrategyId("S-001"),
-            last_px=Price.from_str("45500.00"),
-        )
-
-        position = Position(BTCUSDT_BINANCE, fill1)
-
-        # Act
-        result1 = account.calculate_pnls(
-            instrument=BTCUSDT_BINANCE,
-            fill=fill1,
-            position=position,
-        )
-
-        order2 = self.order_factory.market(
-            BTCUSDT_BINANCE.id,
-            OrderSide.BUY,
-            Quantity.from_str("0.500000"),
-        )
-
-        fill2 = TestEventStubs.order_filled(
-            order2,
-            instrument=BTCUSDT_BINANCE,
-            position_id=PositionId("P-123456"),
-            strategy_id=StrategyId("S-001"),
-            last_px=Price.from_str("45500.00"),
-        )
-
-        position.apply(fill2)
-
-        result2 = account.calculate_pnls(
-            instrument=BTCUSDT_BINANCE,
-            fill=fill2,
-            position=position,
-        )
-
-        # Assert (does not include commission)
-        assert result1 == [Money(-0.50000000, BTC), Money(22750.00000000, USDT)]
-        assert result2 == [Money(0.50000000, BTC), Money(-22750.00000000, USDT)]
-
-    def test_calculate_pnls_for_multi_currency_cash_account_adabtc(self):
-        # Arrange
-        event = AccountState(
-            account_id=AccountId("SIM-001"),
-            account_type=AccountType.CASH,
-            base_currency=None,  # Multi-currency
-            reported=True,
-            balances=[
-                AccountBalance(
-                    Money(1.00000000, BTC),
-                    Money(0.00000000, BTC),
-                    Money(1.00000000, BTC),
-                ),
-                AccountBalance(
-                    Money(1000.00000000, ADA),
-                    Money(0.00000000, ADA),
-                    Money(1000.00000000, ADA),
-                ),
+            [
+                [
+                    _balance(BTC, 1.00000000, 0.00000000, 1.00000000),
+                    _balance(ADA, 1000.00000000, 0.00000000, 1000.00000000),
+                ],
+                None,  # Multi-currency
+                ADABTC_BINANCE,
+                [
+                    (
+                        OrderSide.BUY,
+                        Quantity.from_int(100),
+                        Price.from_str("0.00004100"),
+                        [Money(100.000000, ADA), Money(-0.00410000, BTC)],
+                    ),
+                ],
             ],
-            margins=[],
-            info={},  # No default currency set
-            event_id=UUID4(),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        account = CashAccount(event)
+        ],
+        ids=["single_currency_audusd", "multi_currency_btcusdt", "multi_currency_adabtc"],
+    )
+    def test_calculate_pnls_for_cash_account(
+        self,
+        order_factory,
+        balances,
+        base_currency,
+        instrument,
+        fills,
+    ):
+        # Arrange
+        account = _make_account(balances, base_currency)
+        position = None
 
-        order = self.order_factory.market(
-            ADABTC_BINANCE.id,
-            OrderSide.BUY,
-            Quantity.from_int(100),
-        )
+        for side, quantity, last_px, expected in fills:
+            order = order_factory.market(instrument.id, side, quantity)
 
-        fill = TestEventStubs.order_filled(
-            order,
-            instrument=ADABTC_BINANCE,
-            position_id=PositionId("P-123456"),
-            strategy_id=StrategyId("S-001"),
-            last_px=Price.from_str("0.00004100"),
-        )
+            fill = TestEventStubs.order_filled(
+                order,
+                instrument=instrument,
+                position_id=PositionId("P-123456"),
+                strategy_id=StrategyId("S-001"),
+                last_px=last_px,
+            )
 
-        position = Position(ADABTC_BINANCE, fill)
+            if position is None:
+                position = Position(instrument, fill)
+            else:
+                position.apply(fill)
 
-        # Act
-        result = account.calculate_pnls(
-            instrument=ADABTC_BINANCE,
-            fill=fill,
-            position=position,
-        )
+            # Act
+            result = account.calculate_pnls(
+                instrument=instrument,
+                fill=fill,
+                position=position,
+            )
 
-        # Assert (does not include commission)
-        assert result == [Money(100.000000, ADA), Money(-0.00410000, BTC)]
+            # Assert (does not include commission)
+            assert result == expected
 
     def test_calculate_commission_when_given_liquidity_side_none_raises_value_error(
         self,
     ):
         # Arrange
         account = TestExecStubs.cash_account()
-        instrument = TestInstrumentProvider.xbtusd_bitmex()
+        instrument = XBTUSD_BITMEX
 
         # Act, Assert
         with pytest.raises(ValueError):
             account.calculate_commission(
                 instrument=instrument,
-                last_qty=Quantity.from_int(100_000),
-                last_px=Price.from_str("11450.50"),
+                last_qty=XBTUSD_QTY,
+                last_px=XBTUSD_PX,
                 liquidity_side=LiquiditySide.NO_LIQUIDITY_SIDE,
             )
 
@@ -547,13 +421,13 @@ class TestCashAccount:
     def test_calculate_commission_for_inverse_maker_crypto(self, inverse_as_quote, expected):
         # Arrange
         account = TestExecStubs.cash_account()
-        instrument = TestInstrumentProvider.xbtusd_bitmex()
+        instrument = XBTUSD_BITMEX
 
         # Act
         result = account.calculate_commission(
             instrument=instrument,
-            last_qty=Quantity.from_int(100_000),
-            last_px=Price.from_str("11450.50"),
+            last_qty=XBTUSD_QTY,
+            last_px=XBTUSD_PX,
             liquidity_side=LiquiditySide.MAKER,
             inverse_as_quote=inverse_as_quote,
         )
@@ -580,13 +454,13 @@ class TestCashAccount:
     def test_calculate_commission_crypto_taker(self):
         # Arrange
         account = TestExecStubs.cash_account()
-        instrument = TestInstrumentProvider.xbtusd_bitmex()
+        instrument = XBTUSD_BITMEX
 
         # Act
         result = account.calculate_commission(
             instrument=instrument,
-            last_qty=Quantity.from_int(100_000),
-            last_px=Price.from_str("11450.50"),
+            last_qty=XBTUSD_QTY,
+            last_px=XBTUSD_PX,
             liquidity_side=LiquiditySide.TAKER,
         )
 
@@ -596,7 +470,7 @@ class TestCashAccount:
     def test_calculate_commission_fx_taker(self):
         # Arrange
         account = TestExecStubs.cash_account()
-        instrument = TestInstrumentProvider.default_fx_ccy("USD/JPY", Venue("IDEALPRO"))
+        instrument = USDJPY_IDEALPRO
 
         # Act
         result = account.calculate_commission(
@@ -17,38 +17,21 @@ from decimal import Decimal
 
 import pytest
 
-from nautilus_trader.common.clock import TestClock
-from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.model.currencies import BTC
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.enums import PositionSide
 from nautilus_trader.model.identifiers import AccountId
-from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.execution import TestExecStubs
-from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
-USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
-ADABTC_BINANCE = TestInstrumentProvider.adabtc_binance()
-BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
 
 
 class TestMarginAccount:
-    def setup(self):
-        # Fixture Setup
-        self.trader_id = TestIdStubs.trader_id()
-
-        self.order_factory = OrderFactory(
-            trader_id=self.trader_id,
-            strategy_id=StrategyId("S-001"),
-            clock=TestClock(),
-        )
-
     def test_instantiated_accounts_basic_properties(self):
         # Arrange, Act
         account = TestExecStubs.margin_account()